@@ -2,8 +2,12 @@ import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
+from collections import OrderedDict
+import asyncio
+import concurrent.futures
 import subprocess
 import json
+import sqlite3
 import threading
 import time
 from typing import List, Optional, Tuple
@@ -19,32 +23,64 @@ try:
 
         def __init__(self, ui_app):
             self.ui_app = ui_app
+            # Dotless, matching VideoEditorUI.video_extensions
             self.supported_extensions = ui_app.video_extensions
 
+        @staticmethod
+        def _suffix(file_path):
+            """Lowercased extension of a path, or None if it has no dot."""
+            dot = file_path.rfind('.')
+            if dot < 0:
+                return None
+            return file_path[dot + 1:].lower()
+
+        def on_modified(self, event):
+            """Record write activity so waiters can detect when a file goes quiet."""
+            if event.is_directory:
+                return
+            if self._suffix(event.src_path) in self.supported_extensions:
+                self.ui_app.note_file_activity(event.src_path)
+
+        def on_closed(self, event):
+            """Signal waiters that a file opened for writing has been closed."""
+            if event.is_directory:
+                return
+            if self._suffix(event.src_path) in self.supported_extensions:
+                self.ui_app.note_file_closed(event.src_path)
+
         def on_created(self, event):
             """Called when a new file is created."""
             if event.is_directory:
                 return
 
             file_path = event.src_path
-            if Path(file_path).suffix.lower() in self.supported_extensions:
-                # Refresh the video list on the main thread
-                self.ui_app.root.after(0, self.ui_app.load_videos)
-                # Auto-process if enabled
+            if self._suffix(file_path) in self.supported_extensions:
+                # Refresh the video list on the main thread; bursts of events
+                # coalesce into a single reload
+                self.ui_app.request_reload()
+                # Auto-process if enabled; the bounded pool keeps a bulk file
+                # drop from spawning one thread (and ffmpeg) per event
                 if self.ui_app.auto_process_var.get():
-                    # Run processing in a separate thread to avoid blocking
-                    import threading
-                    thread = threading.Thread(target=self.ui_app.process_new_video, args=(file_path,))
-                    thread.daemon = True
+                    # Register for readiness tracking before queueing so no
+                    # modify/close event can slip between the two
+                    self.ui_app.track_file_readiness(file_path)
                     try:
-                        thread.start()
-                    except Exception as e:
-                        print(f"Warning: Could not start auto-processing thread: {e}")
+                        self.ui_app.auto_exec.submit(self.ui_app.process_new_video, file_path)
+                    except RuntimeError as e:
+                        print(f"Warning: Could not queue auto-processing job: {e}")
 
 except ImportError:
     WATCHDOG_AVAILABLE = False
     VideoFileHandler = None
 
+# Try to import PyAV for in-process metadata probing (no ffprobe fork needed)
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    av = None
+    AV_AVAILABLE = False
+
 class VideoEditorUI:
     """
     A GUI application for video frame editing operations.
@@ -68,21 +104,98 @@ class VideoEditorUI:
         
         # Variables
         self.video_dir = tk.StringVar()
+        # Plain-string copy of video_dir, updated on the main thread in
+        # load_videos. Worker threads read this instead of video_dir.get(),
+        # which is a Tcl call that blocks on the main loop - never safe while
+        # holding a lock the main thread also takes.
+        self._current_dir = ''
         self.video_listbox = None
         self.videos: List[str] = []  # List of video paths
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="Ready")
         self.is_processing = False
+        self._closing = False  # Set on close; jobs must not touch Tk after it
         self.auto_process_var = tk.BooleanVar(value=False)
+        self.max_workers_var = tk.IntVar(value=min(8, os.cpu_count() or 4))
         self.observer = None  # File watcher observer
         self.watching = False  # Flag to track if watching is active
-        self.lock = threading.Lock()
+        self._ffmpeg_ok: Optional[bool] = None  # Memoized _check_ffmpeg result
+
+        # Cache of ffprobe results keyed by (abspath, mtime_ns, size) so repeated
+        # lookups for the same unchanged file don't fork ffprobe again.
+        self._info_cache: "OrderedDict[Tuple[str, int, int], Tuple[float, float]]" = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        self._info_cache_max = 4096
+
+        # Highest counter seen per (output_dir, pattern), so each new output
+        # name costs a dict increment instead of a full directory rescan.
+        # Guarded by a dedicated reentrant lock so the critical section is a
+        # single dict update and worker threads never queue behind it.
+        self._counters: dict = {}
+        self._counter_lock = threading.RLock()
+
+        # Persistent probe cache (SQLite in the selected directory) so a
+        # relaunch doesn't re-probe thousands of unchanged files.
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_dir: Optional[str] = None
+        self._db_lock = threading.Lock()
+
+        # File-readiness tracking fed by watchdog events; see wait_for_file_ready
+        self._file_closed_events: dict = {}  # path -> threading.Event
+        self._file_last_activity: dict = {}  # path -> time.monotonic() of last write
+
+        # Background asyncio loop for batch ffmpeg jobs: one event-loop
+        # thread coordinates every in-flight subprocess instead of parking a
+        # worker thread per ffmpeg run. Started lazily on first batch.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Bounded pool for auto-processing new files; bulk drops queue here
+        # rather than racing hundreds of concurrent ffmpeg runs.
+        self.auto_exec = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='autoproc')
+
+        # Buffered progress/status values, flushed to the Tk variables at a
+        # fixed cadence so worker threads don't fire a variable trace (and
+        # redraw) per processed video.
+        self._pending_progress: Optional[float] = None
+        self._pending_status: Optional[str] = None
+
+        # True while a coalesced video-list reload is queued on the Tk loop
+        self._reload_pending = False
         
-        # Supported video formats
-        self.video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', '.3gp'}
+        # Supported video formats, stored dotless so event/scan paths can
+        # test name.rpartition('.')[2] without building a '.suffix' string
+        self.video_extensions = frozenset(
+            {'mp4', 'avi', 'mov', 'mkv', 'flv', 'wmv', 'webm', 'm4v', '3gp'})
         
         self.setup_ui()
-    
+        self.root.after(self.UI_FLUSH_INTERVAL_MS, self._flush_ui)
+
+    # How often buffered progress/status updates are pushed to the widgets
+    UI_FLUSH_INTERVAL_MS = 200
+
+    # On-disk probe cache kept alongside the videos it describes
+    DB_FILENAME = '.imaginevideo.cache.db'
+
+    # Constant portions of the ffmpeg command lines, hoisted so the per-video
+    # loops only splice in the paths and the formatted offsets
+    FFMPEG_EXTRACT_HEAD = ('ffmpeg', '-y', '-sseof')
+    FFMPEG_EXTRACT_OPTS = ('-update', '1', '-q:v', '1')
+    FFMPEG_TRIM_HEAD = ('ffmpeg', '-y', '-i')  # Overwrite output
+    FFMPEG_TRIM_OPTS = ('-c', 'copy', '-avoid_negative_ts', 'make_zero')  # No re-encoding
+
+    def _flush_ui(self):
+        """Apply buffered progress/status updates on the Tk thread (~5 Hz)."""
+        progress = self._pending_progress
+        if progress is not None:
+            self._pending_progress = None
+            self.progress_var.set(progress)
+        status = self._pending_status
+        if status is not None:
+            self._pending_status = None
+            self.status_var.set(status)
+        self.root.after(self.UI_FLUSH_INTERVAL_MS, self._flush_ui)
+
     def setup_ui(self):
         """Set up the user interface components."""
         # Configure grid weights
@@ -96,7 +209,9 @@ class VideoEditorUI:
         ttk.Label(dir_frame, text="Directory:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         ttk.Entry(dir_frame, textvariable=self.video_dir, width=50).grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
         ttk.Button(dir_frame, text="Browse", command=self.browse_dir).grid(row=0, column=2, padx=(0, 5))
-        ttk.Button(dir_frame, text="Load Videos", command=self.load_videos).grid(row=0, column=3)
+        ttk.Button(dir_frame, text="Load Videos", command=self.load_videos).grid(row=0, column=3, padx=(0, 5))
+        ttk.Button(dir_frame, text="Clear Cache", command=self.clear_info_cache).grid(row=0, column=4, padx=(0, 5))
+        ttk.Button(dir_frame, text="Recheck FFmpeg", command=self.recheck_ffmpeg).grid(row=0, column=5)
         dir_frame.columnconfigure(1, weight=1)
 
         # Auto-process toggle
@@ -155,14 +270,40 @@ class VideoEditorUI:
         ttk.Label(trim_frame, text="Trim Last Frame:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
         ttk.Button(trim_frame, text="Selected", command=lambda: self.trim_last_frames(selected=True)).grid(row=0, column=1, padx=2)
         ttk.Button(trim_frame, text="All", command=lambda: self.trim_last_frames(selected=False)).grid(row=0, column=2, padx=2)
-        
+
+        # Concurrency setting for batch operations
+        workers_frame = ttk.Frame(btn_frame)
+        workers_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        ttk.Label(workers_frame, text="Parallel jobs:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        ttk.Spinbox(workers_frame, from_=1, to=32, width=5, textvariable=self.max_workers_var).grid(row=0, column=1)
+
         btn_frame.columnconfigure(0, weight=1)
     
+    def request_reload(self):
+        """Schedule a video-list reload, merging bursts into one refresh.
+
+        Called from the watchdog thread; only the first request in a burst
+        queues _reload_once, so N creation events cost one load_videos.
+        """
+        if not self._reload_pending:
+            self._reload_pending = True
+            self.root.after_idle(self._reload_once)
+
+    def _reload_once(self):
+        """Run the coalesced reload on the Tk thread."""
+        self._reload_pending = False
+        self.load_videos()
+
     def browse_dir(self):
         """Open directory browser and load videos from selected directory."""
         directory = filedialog.askdirectory(title="Select Video Directory")
         if directory:
             self.stop_watching()  # Stop any previous watcher
+            if directory != self.video_dir.get():
+                # Output dirs change with the directory; never reset counters
+                # for the current one or in-flight jobs could collide
+                with self._counter_lock:
+                    self._counters.clear()
             self.video_dir.set(directory)
             self.load_videos()
     
@@ -176,23 +317,32 @@ class VideoEditorUI:
         if not os.path.exists(dir_path):
             messagebox.showerror("Error", "Selected directory does not exist.")
             return
-        
+
+        self._current_dir = dir_path
+
         try:
             self.videos = []
             self.video_listbox.delete(0, tk.END)
             
-            # Find video files
+            # Find video files; scandir avoids a stat call per entry and the
+            # extension set lookup is bound locally for the tight loop
             video_files = []
-            for file in os.listdir(dir_path):
-                if Path(file).suffix.lower() in self.video_extensions:
-                    video_files.append(file)
+            video_extensions = self.video_extensions
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if entry.name.rpartition('.')[2].lower() in video_extensions:
+                        video_files.append(entry.name)
             
             video_files.sort()  # Sort alphabetically for consistent order
             
-            for filename in video_files:
-                video_path = os.path.join(dir_path, filename)
-                self.videos.append(video_path)
-                self.video_listbox.insert(tk.END, Path(filename).stem)
+            self.videos = [os.path.join(dir_path, filename) for filename in video_files]
+
+            # One insert call for the whole batch - per-item inserts make Tk
+            # reprocess the widget once per video
+            if video_files:
+                self.video_listbox.insert(tk.END, *(os.path.splitext(f)[0] for f in video_files))
             
             # Update video count
             count = len(self.videos)
@@ -226,12 +376,77 @@ class VideoEditorUI:
                         pass
         return max_num
 
-    def wait_for_file_ready(self, file_path: str, max_wait: int = 60, check_interval: float = 1.0) -> bool:
-        """Wait until the file size stabilizes, indicating it's fully written."""
-        import time
-        start_time = time.time()
+    def _next_counter(self, output_dir: str, pattern: str) -> int:
+        """Return the next unused counter for output files in a directory.
+
+        The first call for a given (output_dir, pattern) scans the directory
+        once via get_max_counter; subsequent calls are a dict increment.
+        The counter lock is reentrant, so callers reserving several names
+        atomically can hold it across multiple calls.
+        """
+        key = (output_dir, pattern)
+        with self._counter_lock:
+            if key not in self._counters:
+                self._counters[key] = self.get_max_counter(output_dir, pattern)
+            self._counters[key] += 1
+            return self._counters[key]
+
+    def track_file_readiness(self, file_path: str):
+        """Start tracking a file that wait_for_file_ready will wait on.
+
+        Only registered paths accumulate activity/close state, so watcher
+        events for files nobody waits on (auto-process off) don't grow the
+        tracking dicts for the life of the session.
+        """
+        self._file_closed_events.setdefault(file_path, threading.Event())
+        self._file_last_activity[file_path] = time.monotonic()
+
+    def note_file_activity(self, file_path: str):
+        """Record a watchdog create/modify event for a tracked file."""
+        if file_path in self._file_last_activity:
+            self._file_last_activity[file_path] = time.monotonic()
+
+    def note_file_closed(self, file_path: str):
+        """Record a watchdog close event and wake any waiter on the file."""
+        event = self._file_closed_events.get(file_path)
+        if event is not None:
+            self._file_last_activity[file_path] = time.monotonic()
+            event.set()
+
+    def wait_for_file_ready(self, file_path: str, max_wait: int = 60, quiet_period: float = 2.0) -> bool:
+        """Wait until the file is fully written, driven by watcher events.
+
+        Returns as soon as the watcher reports the file closed (inotify
+        IN_CLOSE_WRITE on Linux). On platforms where close events aren't
+        delivered, the file counts as ready after quiet_period seconds with
+        no modification events. Files never seen by the watcher fall back to
+        polling the size until it stabilizes.
+        """
+        closed = self._file_closed_events.setdefault(file_path, threading.Event())
+        deadline = time.monotonic() + max_wait
+        try:
+            while time.monotonic() < deadline:
+                if self._closing:
+                    return False
+                if closed.wait(timeout=0.25):
+                    return True
+                last_activity = self._file_last_activity.get(file_path)
+                if last_activity is None:
+                    # No events recorded (e.g. direct call); poll sizes instead
+                    return self._wait_for_size_stable(file_path, deadline)
+                if time.monotonic() - last_activity >= quiet_period:
+                    return True
+            return False
+        finally:
+            self._file_closed_events.pop(file_path, None)
+            self._file_last_activity.pop(file_path, None)
+
+    def _wait_for_size_stable(self, file_path: str, deadline: float, check_interval: float = 1.0) -> bool:
+        """Poll the file size until it stabilizes, indicating it's fully written."""
         last_size = -1
-        while time.time() - start_time < max_wait:
+        while time.monotonic() < deadline:
+            if self._closing:
+                return False
             try:
                 current_size = os.path.getsize(file_path)
                 if current_size == last_size and current_size > 0:
@@ -244,9 +459,77 @@ class VideoEditorUI:
             time.sleep(check_interval)
         return False
 
+    def _max_workers(self) -> int:
+        """Concurrency cap for batch jobs, from the 'Parallel jobs' setting."""
+        try:
+            return max(1, self.max_workers_var.get())
+        except tk.TclError:
+            return os.cpu_count() or 4
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background asyncio loop, starting its thread on first use."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever,
+                             name='ffmpeg-loop', daemon=True).start()
+        return self._loop
+
+    async def _run_ffmpeg_async(self, cmd, what: str) -> bool:
+        """Run one ffmpeg command on the event loop; True on a clean exit."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        try:
+            returncode = await asyncio.wait_for(proc.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print(f"Timeout {what}")
+            return False
+        if returncode != 0:
+            print(f"ffmpeg exited with {returncode} {what}")
+            return False
+        return True
+
+    async def _run_batch_async(self, jobs, job_coro, total_videos: int, workers: int) -> int:
+        """Run per-video coroutines with bounded concurrency, updating progress.
+
+        jobs is a list of (video_path, output_path); job_coro is one of the
+        _*_job_async methods. Returns the number of successful videos.
+        """
+        sem = asyncio.Semaphore(workers)
+
+        async def one(video_path, output_path):
+            try:
+                async with sem:
+                    return video_path, await job_coro(video_path, output_path)
+            except Exception as e:
+                print(f"Error processing {video_path}: {e}")
+                return video_path, False
+
+        success_count = 0
+        done = 0
+        for future in asyncio.as_completed([one(v, o) for v, o in jobs]):
+            video_path, ok = await future
+            done += 1
+            if ok:
+                success_count += 1
+            self._pending_progress = (done / total_videos) * 100
+            self._pending_status = f"Processed: {os.path.basename(video_path)}"
+        return success_count
+
     def on_closing(self):
         """Handle application closing - clean up file watcher."""
+        self._closing = True
         self.stop_watching()
+        # Drop queued auto-process jobs; the pool's threads are non-daemon,
+        # so anything left queued would keep the process alive after close
+        self.auto_exec.shutdown(wait=False, cancel_futures=True)
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
         self.root.destroy()
 
     def toggle_auto_process(self):
@@ -298,84 +581,71 @@ class VideoEditorUI:
             finally:
                 self.observer = None
                 self.watching = False
+                # Counters are NOT cleared here: load_videos restarts the
+                # watcher on every reload, and resetting mid-session would
+                # re-issue numbers still reserved by in-flight jobs
                 self.status_var.set("Ready")
 
     def process_new_video(self, video_path: str):
         """Automatically process a newly added video file."""
         if not self.wait_for_file_ready(video_path):
-            print(f"Timeout waiting for {video_path} to stabilize; skipping auto-processing.")
+            if not self._closing:
+                print(f"Timeout waiting for {video_path} to stabilize; skipping auto-processing.")
+            return
+        if self._closing:
             return
 
-        filename = Path(video_path).stem
-
-        # Extract last frame using FFmpeg
-        try:
-            if not self._check_ffmpeg():
-                return
-
-            output_dir = os.path.join(self.video_dir.get(), "last_frames")
-            os.makedirs(output_dir, exist_ok=True)
-
-            duration, fps = self.get_video_info(video_path)
-            if duration is None or fps is None or duration <= 1 / fps:
-                return
+        filename, ext = os.path.splitext(os.path.basename(video_path))
 
-            seek_offset = 1 / fps
-            with self.lock:
-                current_max = self.get_max_counter(output_dir, "_last_")
-                counter = current_max + 1
-                frame_path = os.path.join(output_dir, f"{filename}_last_{counter}.jpg")
-                open(frame_path, 'a').close()  # Create placeholder file
-            cmd = [
-                'ffmpeg', '-y',
-                '-sseof', f'-{seek_offset}',
-                '-i', video_path,
-                '-update', '1',
-                '-q:v', '1',
-                frame_path
-            ]
-            subprocess.run(cmd, capture_output=True, check=True, timeout=300)
+        # One ffmpeg check and one info fetch drive both operations
+        if not self._check_ffmpeg():
+            return
 
-        except Exception as e:
-            print(f"Error extracting frame from {video_path}: {e}")
+        duration, fps = self.get_video_info(video_path)
+        if duration is None or fps is None or duration <= 1 / fps:
+            return
 
-        # Trim last frame
         try:
-            if not self._check_ffmpeg():
-                return
-
-            output_dir = os.path.join(self.video_dir.get(), "trimmed_videos")
-            os.makedirs(output_dir, exist_ok=True)
-
-            duration, fps = self.get_video_info(video_path)
-            if duration is None or fps is None:
-                return
-
-            if duration <= 1 / fps:  # Less than or equal to one frame
-                return
+            # _current_dir, not video_dir.get(): this thread may outlive
+            # the Tk interpreter
+            frames_dir = os.path.join(self._current_dir, "last_frames")
+            trimmed_dir = os.path.join(self._current_dir, "trimmed_videos")
+            os.makedirs(frames_dir, exist_ok=True)
+            os.makedirs(trimmed_dir, exist_ok=True)
 
+            seek_offset = 1 / fps
             trim_duration = duration - (1 / fps)
-            ext = Path(video_path).suffix
-            with self.lock:
-                current_max = self.get_max_counter(output_dir, "_trimmed_")
-                counter = current_max + 1
-                out_path = os.path.join(output_dir, f"{filename}_trimmed_{counter}{ext}")
-                open(out_path, 'a').close()  # Create placeholder file
+            with self._counter_lock:
+                counter = self._next_counter(frames_dir, "_last_")
+                frame_path = os.path.join(frames_dir, f"{filename}_last_{counter}.jpg")
+                counter = self._next_counter(trimmed_dir, "_trimmed_")
+                out_path = os.path.join(trimmed_dir, f"{filename}_trimmed_{counter}{ext}")
 
+            extract_cmd = (*self.FFMPEG_EXTRACT_HEAD, f'-{seek_offset:.6f}',
+                           '-i', video_path, *self.FFMPEG_EXTRACT_OPTS, frame_path)
             # FFmpeg command: copy streams up to trim_duration
-            cmd = [
-                'ffmpeg', '-y',  # Overwrite output
-                '-i', video_path,
-                '-t', str(trim_duration),
-                '-c', 'copy',  # No re-encoding
-                '-avoid_negative_ts', 'make_zero',
-                out_path
-            ]
+            trim_cmd = (*self.FFMPEG_TRIM_HEAD, video_path,
+                        '-t', f'{trim_duration:.6f}', *self.FFMPEG_TRIM_OPTS, out_path)
 
-            subprocess.run(cmd, capture_output=True, check=True, timeout=300)
+            # Run extract and trim side by side; both only read the input
+            procs = [subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                     for cmd in (extract_cmd, trim_cmd)]
+            try:
+                for proc, cmd in zip(procs, (extract_cmd, trim_cmd)):
+                    returncode = proc.wait(timeout=300)
+                    if returncode != 0:
+                        raise subprocess.CalledProcessError(returncode, cmd)
+            except Exception:
+                # Kill and reap both children so a timeout or a failure in
+                # one command can't leave a hung ffmpeg behind
+                for proc in procs:
+                    if proc.poll() is None:
+                        proc.kill()
+                    proc.wait()
+                raise
 
         except Exception as e:
-            print(f"Error trimming {video_path}: {e}")
+            print(f"Error auto-processing {video_path}: {e}")
 
     def get_selected_videos(self, selected: bool = True) -> List[str]:
         """Get list of selected videos or all videos."""
@@ -404,83 +674,229 @@ class VideoEditorUI:
     def _extract_last_frames_thread(self, videos: List[str]):
         """Thread function for extracting last frames."""
         self.is_processing = True
-        self.progress_var.set(0)
-        self.status_var.set("Extracting last frames...")
-        
+        self._pending_progress = 0.0
+        self._pending_status = "Extracting last frames..."
+
         try:
             if not self._check_ffmpeg():
                 raise Exception("FFmpeg not available")
 
             output_dir = os.path.join(self.video_dir.get(), "last_frames")
             os.makedirs(output_dir, exist_ok=True)
-            
-            success_count = 0
+
             total_videos = len(videos)
-            
-            for i, video_path in enumerate(videos):
-                try:
-                    # Update progress
-                    progress = (i / total_videos) * 100
-                    self.progress_var.set(progress)
-                    self.status_var.set(f"Processing: {Path(video_path).name}")
-                    
+
+            # Reserve output names in one pass, then fan jobs out to the loop.
+            jobs = []
+            with self._counter_lock:
+                for video_path in videos:
                     if not os.path.exists(video_path):
                         continue
-                    
-                    duration, fps = self.get_video_info(video_path)
-                    if duration is None or fps is None or duration <= 1 / fps:
-                        continue
-                    
-                    seek_offset = 1 / fps
-                    filename = Path(video_path).stem
-                    with self.lock:
-                        current_max = self.get_max_counter(output_dir, "_last_")
-                        counter = current_max + 1
-                        frame_path = os.path.join(output_dir, f"{filename}_last_{counter}.jpg")
-                        open(frame_path, 'a').close()  # Create placeholder file
-                    cmd = [
-                        'ffmpeg', '-y',
-                        '-sseof', f'-{seek_offset}',
-                        '-i', video_path,
-                        '-update', '1',
-                        '-q:v', '1',
-                        frame_path
-                    ]
-                    subprocess.run(cmd, capture_output=True, check=True, timeout=300)
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    print(f"Error processing {video_path}: {e}")
-                    continue
-            
+                    filename = os.path.splitext(os.path.basename(video_path))[0]
+                    counter = self._next_counter(output_dir, "_last_")
+                    frame_path = os.path.join(output_dir, f"{filename}_last_{counter}.jpg")
+                    jobs.append((video_path, frame_path))
+
+            success_count = 0
+            if jobs:
+                batch = self._run_batch_async(jobs, self._extract_job_async,
+                                              total_videos, self._max_workers())
+                success_count = asyncio.run_coroutine_threadsafe(
+                    batch, self._get_loop()).result()
+
             # Update UI on main thread
             self.root.after(0, lambda: self._extraction_complete(success_count, output_dir, total_videos))
-            
+
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Error", f"Extraction failed: {str(e)}"))
         finally:
             self.is_processing = False
+
+    async def _extract_job_async(self, video_path: str, frame_path: str) -> bool:
+        """Extract the last frame of one video. Runs on the event loop."""
+        # The probe can block (ffprobe fallback), so keep it off the loop
+        loop = asyncio.get_running_loop()
+        duration, fps = await loop.run_in_executor(None, self.get_video_info, video_path)
+        if duration is None or fps is None or duration <= 1 / fps:
+            return False
+
+        seek_offset = 1 / fps
+        cmd = (*self.FFMPEG_EXTRACT_HEAD, f'-{seek_offset:.6f}',
+               '-i', video_path, *self.FFMPEG_EXTRACT_OPTS, frame_path)
+        return await self._run_ffmpeg_async(
+            cmd, f"extracting from {os.path.basename(video_path)}")
     
     def _extraction_complete(self, success_count: int, output_dir: str, total_videos: int):
         """Handle completion of frame extraction."""
+        self._pending_progress = None  # Don't let a stale buffered update win
+        self._pending_status = None
         self.progress_var.set(100)
         self.status_var.set(f"Extracted {success_count}/{total_videos} frames")
         messagebox.showinfo("Success", f"Extracted last frames from {success_count} out of {total_videos} videos to '{output_dir}'.")
     
+    def _get_db(self) -> Optional[sqlite3.Connection]:
+        """Return the probe-cache connection for the current directory.
+
+        Opens (and creates) the database lazily, switching files when the
+        selected directory changes. Callers must hold _db_lock; no Tk call
+        may happen under it, which is why this reads _current_dir. Returns
+        None when no directory is selected or SQLite can't open the file.
+        """
+        dir_path = self._current_dir
+        if not dir_path or not os.path.isdir(dir_path):
+            return None
+        if self._db is not None and self._db_dir == dir_path:
+            return self._db
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            self._db_dir = None
+        try:
+            db = sqlite3.connect(os.path.join(dir_path, self.DB_FILENAME),
+                                 check_same_thread=False)
+            db.execute('CREATE TABLE IF NOT EXISTS probe ('
+                       'path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, '
+                       'duration REAL, fps REAL)')
+            db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open probe cache in {dir_path}: {e}")
+            return None
+        self._db = db
+        self._db_dir = dir_path
+        return db
+
+    def _db_lookup(self, cache_key: Tuple[str, int, int]) -> Optional[Tuple[float, float]]:
+        """Fetch a cached (duration, fps) row for the key, or None on miss."""
+        with self._db_lock:
+            db = self._get_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    'SELECT duration, fps FROM probe WHERE path=? AND mtime=? AND size=?',
+                    cache_key).fetchone()
+            except sqlite3.Error:
+                return None
+        return row
+
+    def _db_store(self, cache_key: Tuple[str, int, int], duration: float, fps: float):
+        """Persist a probe result; stale rows for the path are replaced."""
+        with self._db_lock:
+            db = self._get_db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        'INSERT OR REPLACE INTO probe (path, mtime, size, duration, fps) '
+                        'VALUES (?, ?, ?, ?, ?)', (*cache_key, duration, fps))
+            except sqlite3.Error:
+                pass
+
+    def clear_info_cache(self):
+        """Drop cached probe results, both in memory and on disk."""
+        with self._info_cache_lock:
+            self._info_cache.clear()
+        with self._db_lock:
+            db = self._get_db()
+            if db is not None:
+                try:
+                    with db:
+                        db.execute('DELETE FROM probe')
+                except sqlite3.Error as e:
+                    print(f"Warning: Could not clear probe cache: {e}")
+        self.status_var.set("Metadata cache cleared")
+
     def get_video_info(self, video_path: str) -> Tuple[Optional[float], Optional[float]]:
-        """Use ffprobe to get duration and fps of a video file."""
+        """Get duration and fps of a video file.
+
+        Uses PyAV to read the container metadata in-process when available
+        (no fork, no JSON round-trip); otherwise falls back to ffprobe.
+        Results are cached per (path, mtime, size), first in memory and then
+        in a SQLite file next to the videos, so repeated calls - including
+        ones from a previous session - skip the probe.
+        """
+        try:
+            stat = os.stat(video_path)
+            cache_key = (os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            with self._info_cache_lock:
+                cached = self._info_cache.get(cache_key)
+                if cached is not None:
+                    self._info_cache.move_to_end(cache_key)
+                    return cached
+
+        if cache_key is not None:
+            row = self._db_lookup(cache_key)
+            if row is not None:
+                duration, fps = row
+                with self._info_cache_lock:
+                    self._info_cache[cache_key] = (duration, fps)
+                    self._info_cache.move_to_end(cache_key)
+                    while len(self._info_cache) > self._info_cache_max:
+                        self._info_cache.popitem(last=False)
+                return duration, fps
+
+        duration, fps = (None, None)
+        if AV_AVAILABLE:
+            duration, fps = self._probe_with_pyav(video_path)
+        if duration is None or fps is None:
+            duration, fps = self._probe_with_ffprobe(video_path)
+        if duration is None or fps is None:
+            return None, None
+
+        if cache_key is not None:
+            with self._info_cache_lock:
+                self._info_cache[cache_key] = (duration, fps)
+                self._info_cache.move_to_end(cache_key)
+                while len(self._info_cache) > self._info_cache_max:
+                    self._info_cache.popitem(last=False)
+            self._db_store(cache_key, duration, fps)
+
+        return duration, fps
+
+    def _probe_with_pyav(self, video_path: str) -> Tuple[Optional[float], Optional[float]]:
+        """Read duration and fps from the container via PyAV (in-process)."""
+        try:
+            container = av.open(video_path, metadata_errors='ignore')
+            try:
+                if not container.streams.video or container.duration is None:
+                    return None, None
+                stream = container.streams.video[0]
+                duration = float(container.duration) / av.time_base
+                rate = stream.average_rate or stream.guessed_rate
+                fps = float(rate) if rate else 30.0  # Fallback
+                return duration, fps
+            finally:
+                container.close()
+        except Exception as e:
+            print(f"PyAV failed on {Path(video_path).name}, falling back to ffprobe: {e}")
+            return None, None
+
+    def _probe_with_ffprobe(self, video_path: str) -> Tuple[Optional[float], Optional[float]]:
+        """Read duration and fps by forking ffprobe."""
+        # Only request the fields we read; -show_format/-show_streams dumps
+        # every codec/tag and can run to tens of KB of JSON per file
         cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_format', '-show_streams', video_path
+            'ffprobe', '-v', 'error', '-select_streams', 'v:0',
+            '-show_entries', 'stream=codec_type,r_frame_rate:format=duration',
+            '-of', 'json', video_path
         ]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+            # Only stdout matters here; ffprobe chatter on stderr is discarded
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True, timeout=30)
+            if result.returncode != 0:
+                print(f"ffprobe exited with {result.returncode} for {Path(video_path).name}")
+                return None, None
             data = json.loads(result.stdout)
-            
+
             # Get duration from format
             duration = float(data['format']['duration'])
-            
+
             # Get fps from video stream
             video_stream = next((s for s in data['streams'] if s['codec_type'] == 'video'), None)
             if video_stream and 'r_frame_rate' in video_stream:
@@ -491,13 +907,13 @@ class VideoEditorUI:
                     fps = 30.0  # Fallback
             else:
                 fps = 30.0  # Fallback
-            
+
             return duration, fps
-            
+
         except subprocess.TimeoutExpired:
             print(f"Timeout getting info for {Path(video_path).name}")
             return None, None
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ZeroDivisionError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, ZeroDivisionError, ValueError) as e:
             print(f"Error getting info for {Path(video_path).name}: {e}")
             return None, None
     
@@ -523,87 +939,114 @@ class VideoEditorUI:
             thread.daemon = True
             thread.start()
     
+    def recheck_ffmpeg(self):
+        """Forget the memoized ffmpeg check and probe again.
+
+        Lets users who install FFmpeg after launch re-enable operations
+        without restarting; _check_ffmpeg shows its own dialog on failure.
+        """
+        self._ffmpeg_ok = None
+        if self._check_ffmpeg():
+            self.status_var.set("FFmpeg found")
+
     def _check_ffmpeg(self) -> bool:
-        """Check if FFmpeg is available on the system."""
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=10)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        """Check if FFmpeg is available on the system (probed once per session)."""
+        if self._ffmpeg_ok is None:
+            try:
+                result = subprocess.run(['ffmpeg', '-version'],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        timeout=10)
+                self._ffmpeg_ok = result.returncode == 0
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                self._ffmpeg_ok = False
+        if not self._ffmpeg_ok and not self._closing:
             messagebox.showerror("Error", "FFmpeg is not installed or not available. Please install FFmpeg to use trimming functionality.")
-            return False
+        return self._ffmpeg_ok
     
     def _trim_last_frames_thread(self, videos: List[str]):
         """Thread function for trimming last frames."""
         self.is_processing = True
-        self.progress_var.set(0)
-        self.status_var.set("Trimming last frames...")
+        self._pending_progress = 0.0
+        self._pending_status = "Trimming last frames..."
         
         try:
             output_dir = os.path.join(self.video_dir.get(), "trimmed_videos")
             os.makedirs(output_dir, exist_ok=True)
-            
-            success_count = 0
+
             total_videos = len(videos)
-            
-            for i, video_path in enumerate(videos):
-                try:
-                    # Update progress
-                    progress = (i / total_videos) * 100
-                    self.progress_var.set(progress)
-                    self.status_var.set(f"Processing: {Path(video_path).name}")
-                    
+
+            # Reserve output names in one pass, then fan jobs out to the loop.
+            jobs = []
+            with self._counter_lock:
+                for video_path in videos:
                     if not os.path.exists(video_path):
                         continue
-                    
-                    duration, fps = self.get_video_info(video_path)
-                    if duration is None or fps is None:
-                        continue
-                    
-                    if duration <= 1 / fps:  # Less than or equal to one frame
-                        continue
-                    
-                    trim_duration = duration - (1 / fps)
-                    filename = Path(video_path).stem
-                    ext = Path(video_path).suffix
-                    with self.lock:
-                        current_max = self.get_max_counter(output_dir, "_trimmed_")
-                        counter = current_max + 1
-                        out_path = os.path.join(output_dir, f"{filename}_trimmed_{counter}{ext}")
-                        open(out_path, 'a').close()  # Create placeholder file
-                    
-                    # FFmpeg command: copy streams up to trim_duration
-                    cmd = [
-                        'ffmpeg', '-y',  # Overwrite output
-                        '-i', video_path,
-                        '-t', str(trim_duration),
-                        '-c', 'copy',  # No re-encoding
-                        '-avoid_negative_ts', 'make_zero',
-                        out_path
-                    ]
-                    
-                    result = subprocess.run(cmd, capture_output=True, check=True, timeout=300)
-                    success_count += 1
-                    
-                except subprocess.TimeoutExpired:
-                    print(f"Timeout trimming {Path(video_path).name}")
-                    continue
-                except subprocess.CalledProcessError as e:
-                    print(f"Failed to trim {Path(video_path).name}: {e}")
-                    continue
-                except Exception as e:
-                    print(f"Error processing {video_path}: {e}")
-                    continue
-            
+                    filename, ext = os.path.splitext(os.path.basename(video_path))
+                    counter = self._next_counter(output_dir, "_trimmed_")
+                    out_path = os.path.join(output_dir, f"{filename}_trimmed_{counter}{ext}")
+                    jobs.append((video_path, out_path))
+
+            success_count = 0
+            if jobs:
+                batch = self._run_batch_async(jobs, self._trim_job_async,
+                                              total_videos, self._max_workers())
+                success_count = asyncio.run_coroutine_threadsafe(
+                    batch, self._get_loop()).result()
+
             # Update UI on main thread
             self.root.after(0, lambda: self._trimming_complete(success_count, output_dir, total_videos))
-            
+
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Error", f"Trimming failed: {str(e)}"))
         finally:
             self.is_processing = False
+
+    def get_trim_duration(self, video_path: str) -> Optional[float]:
+        """Compute the output duration for dropping the last frame.
+
+        With PyAV the stream's packet count gives the exact duration of all
+        but the last frame with no probe subprocess at all; otherwise this
+        falls back to duration - 1/fps from get_video_info. Returns None for
+        unreadable or single-frame videos.
+        """
+        if AV_AVAILABLE:
+            try:
+                container = av.open(video_path, metadata_errors='ignore')
+                try:
+                    if container.streams.video:
+                        stream = container.streams.video[0]
+                        frames = stream.frames
+                        rate = stream.average_rate or stream.guessed_rate
+                        if frames and frames > 1 and rate:
+                            return float(frames - 1) / float(rate)
+                finally:
+                    container.close()
+            except Exception:
+                pass  # Container without a packet count; use the probe path
+
+        duration, fps = self.get_video_info(video_path)
+        if duration is None or fps is None or duration <= 1 / fps:
+            return None
+        return duration - (1 / fps)
+
+    async def _trim_job_async(self, video_path: str, out_path: str) -> bool:
+        """Trim the last frame off one video. Runs on the event loop."""
+        # The cut-point probe can block (PyAV/ffprobe), so keep it off the loop
+        loop = asyncio.get_running_loop()
+        trim_duration = await loop.run_in_executor(None, self.get_trim_duration, video_path)
+        if trim_duration is None or trim_duration <= 0:
+            return False
+
+        # FFmpeg command: copy streams up to trim_duration
+        cmd = (*self.FFMPEG_TRIM_HEAD, video_path,
+               '-t', f'{trim_duration:.6f}', *self.FFMPEG_TRIM_OPTS, out_path)
+        return await self._run_ffmpeg_async(
+            cmd, f"trimming {os.path.basename(video_path)}")
     
     def _trimming_complete(self, success_count: int, output_dir: str, total_videos: int):
         """Handle completion of frame trimming."""
+        self._pending_progress = None  # Don't let a stale buffered update win
+        self._pending_status = None
         self.progress_var.set(100)
         self.status_var.set(f"Trimmed {success_count}/{total_videos} videos")
         messagebox.showinfo("Success", f"Trimmed last frames from {success_count} out of {total_videos} videos to '{output_dir}'.")